@@ -48,6 +48,7 @@ setup(
         "vault": ["hvac>=0.9.5"],
         "S3": ["boto3>=1.14.56"],
         "notebook_runner": ["IPython>=7.16", "nbformat>=5.0", "regex>=2020.6"],
+        "uvloop": ["uvloop>=0.14.0"],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -65,9 +65,10 @@ class Response(GenericModel, Generic[DataT]):
 
     @validator("meta", pre=True, always=True)
     def default_meta(cls, v, values):
+        # an explicit null total_doc is kept for responses that don't know it
         if v is None:
-            v = Meta().dict()
-        if v.get("total_doc", None) is None:
+            v = Meta().dict(exclude={"total_doc"})
+        if "total_doc" not in v:
             if values.get("data", None) is not None:
                 v["total_doc"] = len(values["data"])
             else:
@@ -1,5 +1,8 @@
-from typing import Dict
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, Dict
 
+from bson import json_util
+from bson.errors import BSONError
 from fastapi import HTTPException, Query
 
 from maggma.api.query_operator import QueryOperator
@@ -10,17 +13,24 @@ class PaginationQuery(QueryOperator):
     """Query opertators to provides Pagination"""
 
     def __init__(
-        self, default_skip: int = 0, default_limit: int = 100, max_limit: int = 1000
+        self,
+        default_skip: int = 0,
+        default_limit: int = 100,
+        max_limit: int = 1000,
+        enable_cursor: bool = False,
     ):
         """
         Args:
             default_skip: the default number of documents to skip
             default_limit: the default number of documents to return
             max_limit: max number of documents to return
+            enable_cursor: whether to accept a cursor for keyset pagination.
+                Only supported by ReadOnlyResource
         """
         self.default_skip = default_skip
         self.default_limit = default_limit
         self.max_limit = max_limit
+        self.enable_cursor = enable_cursor
 
         def query(
             skip: int = Query(
@@ -43,7 +53,31 @@ class PaginationQuery(QueryOperator):
                 )
             return {"skip": skip, "limit": limit}
 
-        self.query = query  # type: ignore
+        def cursor_query(
+            skip: int = Query(
+                default_skip, description="Number of entries to skip in the search"
+            ),
+            limit: int = Query(
+                default_limit,
+                description="Max number of entries to return in a single query."
+                f" Limited to {max_limit}",
+            ),
+            cursor: str = Query(
+                None,
+                description="Cursor to continue from, as given by next_cursor in the"
+                " previous response. Pass an empty cursor to start paginating"
+                " by key, which skips counting the total number of documents",
+            ),
+        ) -> STORE_PARAMS:
+            """
+            Pagination parameters for the API Endpoint including a cursor
+            """
+            params = query(skip=skip, limit=limit)
+            if isinstance(cursor, str):
+                params["cursor"] = cursor
+            return params
+
+        self.query = cursor_query if enable_cursor else query  # type: ignore
 
     def query(self):
         "Stub query function for abstract class"
@@ -54,3 +88,31 @@ class PaginationQuery(QueryOperator):
         Metadata for the pagination params
         """
         return {"max_limit": self.max_limit}
+
+
+# canonical extended JSON keeps the BSON type of key values such as
+# datetimes and ObjectIds, which the key comparison in the store relies on
+_CURSOR_JSON_OPTIONS = json_util.JSONOptions(
+    json_mode=json_util.JSONMode.CANONICAL, tz_aware=False
+)
+
+
+def encode_cursor(key_value: Any) -> str:
+    """
+    Encodes the key value of the last document in a page as an opaque cursor
+    """
+    return urlsafe_b64encode(
+        json_util.dumps(key_value, json_options=_CURSOR_JSON_OPTIONS).encode()
+    ).decode()
+
+
+def decode_cursor(cursor: str) -> Any:
+    """
+    Decodes a cursor made by encode_cursor back into a key value
+    """
+    try:
+        return json_util.loads(
+            urlsafe_b64decode(cursor.encode()), json_options=_CURSOR_JSON_OPTIONS
+        )
+    except (ValueError, BSONError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
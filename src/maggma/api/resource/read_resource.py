@@ -1,12 +1,14 @@
 from inspect import signature
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Type
 
 from fastapi import Depends, HTTPException, Path, Request
 from fastapi import Response as BareResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from maggma.api.models import Meta, Response
 from maggma.api.query_operator import PaginationQuery, QueryOperator, SparseFieldsQuery
+from maggma.api.query_operator.pagination import decode_cursor, encode_cursor
 from maggma.api.resource import Resource
 from maggma.api.resource.utils import attach_query_ops
 from maggma.api.utils import STORE_PARAMS, merge_queries, object_id_serilaization_helper
@@ -68,7 +70,7 @@ class ReadOnlyResource(Resource):
             query_operators
             if query_operators is not None
             else [
-                PaginationQuery(),
+                PaginationQuery(enable_cursor=True),
                 SparseFieldsQuery(
                     model,
                     default_fields=[self.store.key, self.store.last_updated_field],
@@ -76,8 +78,24 @@ class ReadOnlyResource(Resource):
             ]
         )
 
+        # only operators that override post_process need to run on each response
+        self._post_processors = [
+            operator.post_process
+            for operator in self.query_operators
+            if type(operator).post_process is not QueryOperator.post_process
+        ]
+
         super().__init__(model)
 
+        # also connect when the router is mounted without the API class
+        self.router.add_event_handler("startup", self.on_startup)
+
+    def on_startup(self):
+        """
+        Connects the store once so requests can reuse the connection
+        """
+        self.store.connect()
+
     def prepare_endpoint(self):
         """
         Internal method to prepare the endpoint by setting up default handlers
@@ -99,9 +117,17 @@ class ReadOnlyResource(Resource):
                 self.model, [self.store.key, self.store.last_updated_field]
             ).query
         else:
+            key_fields_input = {"properties": self.key_fields}
 
             def field_input():
-                return {"properties": self.key_fields}
+                return key_fields_input
+
+        # bind everything the handler needs up front so each request
+        # avoids looking it up on the resource again
+        store = self.store
+        query = self.query
+        post_processors = self._post_processors
+        disable_validation = self.disable_validation
 
         async def get_by_key(
             key: str = Path(
@@ -118,29 +144,26 @@ class ReadOnlyResource(Resource):
             Returns:
                 a single {model_name} document
             """
-            self.store.connect()
-
             item = [
-                self.store.query_one(
-                    criteria={self.store.key: key, **self.query},
-                    properties=fields["properties"],
+                store.query_one(
+                    criteria={key_name: key, **query}, properties=fields["properties"],
                 )
             ]
 
             if item == [None]:
                 raise HTTPException(
-                    status_code=404,
-                    detail=f"Item with {self.store.key} = {key} not found",
+                    status_code=404, detail=f"Item with {key_name} = {key} not found",
                 )
 
-            for operator in self.query_operators:
-                item = operator.post_process(item)
+            for post_process in post_processors:
+                item = post_process(item)
 
             response = {"data": item}
 
-            if self.disable_validation:
+            if disable_validation:
                 response = BareResponse(  # type: ignore
-                    orjson.dumps(response, default=object_id_serilaization_helper)
+                    orjson.dumps(response, default=object_id_serilaization_helper),
+                    media_type="application/json",
                 )
 
             return response
@@ -158,15 +181,20 @@ class ReadOnlyResource(Resource):
 
         model_name = self.model.__name__
 
+        # the allowed query parameters are fixed once the operators are set
+        query_params = frozenset(
+            entry
+            for operator in self.query_operators
+            for entry in signature(operator.query).parameters
+        )
+
+        # without validation, documents can be streamed straight from the store
+        # as long as no operator has to post-process the full list of results
+        stream_results = self.disable_validation and not self._post_processors
+
         async def search(**queries: Dict[str, STORE_PARAMS]) -> Dict:
             request: Request = queries.pop("request")  # type: ignore
 
-            query_params = [
-                entry
-                for _, i in enumerate(self.query_operators)
-                for entry in signature(i.query).parameters
-            ]
-
             overlap = [
                 key for key in request.query_params.keys() if key not in query_params
             ]
@@ -180,24 +208,81 @@ class ReadOnlyResource(Resource):
 
             query: Dict[Any, Any] = merge_queries(list(queries.values()))  # type: ignore
             query["criteria"].update(self.query)
+            cursor = query.pop("cursor", None)
 
-            self.store.connect()
-
-            count = self.store.count(query["criteria"])
-            data = list(self.store.query(**query))
             operator_meta = {}
-
             for operator in self.query_operators:
-                data = operator.post_process(data)
                 operator_meta.update(operator.meta())
 
+            pagination_meta = {}
+            count: Optional[int]
+            if cursor is None:
+                count = self.store.count(query["criteria"])
+
+                if stream_results:
+                    stream_meta = {**Meta(total_doc=count).dict(), **operator_meta}
+                    return StreamingResponse(  # type: ignore
+                        _stream_response(self.store.query(**query), stream_meta),
+                        media_type="application/json",
+                    )
+
+                data = list(self.store.query(**query))
+            else:
+                # Keyset pagination: continue after the last key of the previous
+                # page in key order, which avoids counting all matching documents
+                if query.get("sort"):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Cursor pagination is always sorted by {} and can't be"
+                        " combined with another sort".format(self.store.key),
+                    )
+                if query.get("skip"):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Cursor pagination continues from the cursor and"
+                        " can't be combined with skip",
+                    )
+
+                # the total is unknown, so it is returned as null
+                count = None
+                key = self.store.key
+                limit = query.get("limit", 0)
+
+                if cursor != "":
+                    key_criteria = {key: {"$gt": decode_cursor(cursor)}}
+                    query["criteria"] = (
+                        {"$and": [query["criteria"], key_criteria]}
+                        if query["criteria"]
+                        else key_criteria
+                    )
+
+                if query["properties"] is not None and key not in query["properties"]:
+                    query["properties"].append(key)
+
+                # Ask for one extra document to know if there is a next page
+                query.update(sort={key: 1}, skip=0, limit=limit + 1 if limit else 0)
+                data = list(self.store.query(**query))
+
+                next_cursor = None
+                if limit and len(data) > limit:
+                    data = data[:limit]
+                    next_cursor = encode_cursor(data[-1][key])
+                pagination_meta["next_cursor"] = next_cursor
+
+            for post_process in self._post_processors:
+                data = post_process(data)
+
             meta = Meta(total_doc=count)
 
-            response = {"data": data, "meta": {**meta.dict(), **operator_meta}}
+            response = {
+                "data": data,
+                "meta": {**meta.dict(), **operator_meta, **pagination_meta},
+            }
 
             if self.disable_validation:
                 response = BareResponse(  # type: ignore
-                    orjson.dumps(response, default=object_id_serilaization_helper)
+                    orjson.dumps(response, default=object_id_serilaization_helper),
+                    media_type="application/json",
                 )
 
             return response
@@ -210,3 +295,18 @@ class ReadOnlyResource(Resource):
             response_description=f"Search for a {model_name}",
             response_model_exclude_unset=True,
         )(attach_query_ops(search, self.query_operators))
+
+
+def _stream_response(docs: Iterator[Dict], meta: Dict) -> Iterator[bytes]:
+    """
+    Encodes a response as JSON one document at a time so the
+    full page never has to be held in memory
+    """
+    yield b'{"data":['
+    for i, doc in enumerate(docs):
+        if i > 0:
+            yield b","
+        yield orjson.dumps(doc, default=object_id_serilaization_helper)
+    yield b'],"meta":'
+    yield orjson.dumps(meta, default=object_id_serilaization_helper)
+    yield b"}"
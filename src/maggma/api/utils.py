@@ -17,7 +17,16 @@ else:
 
 QUERY_PARAMS = ["criteria", "properties", "skip", "limit"]
 STORE_PARAMS = Dict[
-    Literal["criteria", "properties", "sort", "skip", "limit", "request", "pipeline"],
+    Literal[
+        "criteria",
+        "properties",
+        "sort",
+        "skip",
+        "limit",
+        "cursor",
+        "request",
+        "pipeline",
+    ],
     Any,
 ]
 
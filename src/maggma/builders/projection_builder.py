@@ -1,11 +1,14 @@
-from copy import deepcopy
+from collections import defaultdict
 from datetime import datetime
 from itertools import chain
-from typing import Dict, Iterable, List, Set, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from pydash import get
+from pydash.utilities import to_path
+from pymongo.errors import OperationFailure
 
 from maggma.core import Builder, Store
+from maggma.stores import MemoryStore, MongoStore
 from maggma.utils import grouper
 
 
@@ -25,6 +28,11 @@ class Projection_Builder(Builder):
     consider certain key values.
     """
 
+    # process_item only merges dictionaries and holds the GIL, so threads
+    # won't run it in parallel; the gain is not pickling every chunk of
+    # documents out to worker processes and their results back
+    cpu_bound = False
+
     def __init__(
         self,
         source_stores: List[Store],
@@ -55,6 +63,12 @@ class Projection_Builder(Builder):
                 If an empty list or dictionary is provided, all fields of that
                 input store will be projected.
 
+                Fields can be nested paths such as "a.b" or "a.0.b", which are
+                looked up like pydash.get: a numeric segment indexes into an
+                array and a path through an array of subdocuments without an
+                index gives None. Target names are used as is, so "x.y" is a
+                single key of the output document.
+
                 Note fields_to_project is converted into the projection_mapping
                 attribute of this builder. There are no checks for possible
                 overwrite errors in output docs for the target_store.
@@ -98,6 +112,41 @@ class Projection_Builder(Builder):
                     p.update({target_store.key: store.key})
         self.projection_mapping = projection_mapping
 
+        # the database projection for each source store is the same for
+        # every chunk of keys, so build it once here for get_items. Nested
+        # paths are left to the Python lookup (None), since a $project
+        # resolves them differently across arrays and nests dotted names
+        self._source_projections = []  # type: List[Optional[Dict]]
+        # as are the fields to fetch, the keys to strip and the parsed paths
+        # to look up when the projection is done in Python. A database
+        # projection of a nested path doesn't index into arrays, so only
+        # top level fields are fetched
+        self._source_properties = []  # type: List[Optional[List[str]]]
+        self._source_strip_keys = []  # type: List[Set[str]]
+        self._source_paths = []  # type: List[List[Tuple[str, List]]]
+        for store, p in zip(source_stores, projection_mapping):
+            strip_keys = {"_id", store.last_updated_field}
+            self._source_strip_keys.append(strip_keys)
+            self._source_properties.append(
+                None if p == {} else list({v.split(".")[0] for v in p.values()})
+            )
+            self._source_paths.append(
+                [(k, to_path(v)) for k, v in p.items() if k not in strip_keys]
+            )
+
+            if p == {}:  # leave out unneeded fields and keep everything else
+                self._source_projections.append({k: 0 for k in strip_keys})
+            elif any("." in k or "." in v for k, v in p.items()):
+                self._source_projections.append(None)
+            else:  # only the specified fields, under their target names
+                # missing fields are kept as None like a Python lookup would
+                rename = {
+                    k: {"$ifNull": [f"${v}", None]}
+                    for k, v in p.items()
+                    if k not in strip_keys
+                }
+                self._source_projections.append({"_id": 0, **rename})
+
         # establish other attributes and initialization
         self.query_by_key = query_by_key or []
         self.target = target_store
@@ -113,6 +162,68 @@ class Projection_Builder(Builder):
         if not all(index_checks):
             self.logger.warning("Missing indices for key fields on stores.")
 
+    def get_distinct_keys(self) -> Set:
+        """
+        Gets the union of the key values of all source_stores,
+        leaving out None. If the source_stores share a Mongo
+        database the union is computed server-side in a single
+        aggregation, otherwise the distinct key values of each
+        store are combined here.
+
+        Returns:
+            set of key values
+        """
+        # in-memory stores have no round trips to save, so only stores
+        # backed by a Mongo server take part in the server-side union
+        same_database = all(
+            isinstance(s, MongoStore) and not isinstance(s, MemoryStore)
+            for s in self.sources
+        ) and all(
+            s._collection.database == self.sources[0]._collection.database
+            for s in self.sources[1:]
+        )
+
+        if same_database and len(self.sources) > 1:
+            first, *rest = self.sources
+            pipeline = [
+                {"$group": {"_id": f"${first.key}"}}
+            ]  # type: List[Dict[str, Any]]
+            pipeline.extend(
+                {
+                    "$unionWith": {
+                        "coll": s._collection.name,
+                        "pipeline": [{"$group": {"_id": f"${s.key}"}}],
+                    }
+                }
+                for s in rest
+            )
+            pipeline.append({"$match": {"_id": {"$ne": None}}})
+            pipeline.append({"$group": {"_id": "$_id"}})
+            try:
+                return {
+                    d["_id"]
+                    for d in first._collection.aggregate(pipeline, allowDiskUse=True)
+                }
+            except OperationFailure:
+                self.logger.debug(
+                    "Could not get key values in one aggregation, "
+                    "falling back to distinct for each store"
+                )
+
+        unique_keys = set()  # type: Set
+        for store in self.sources:
+            unique_keys.update(store.distinct(field=store.key))
+            # None is dropped after every store so this is a set lookup
+            # rather than a scan of the distinct values
+            if None in unique_keys:
+                unique_keys.discard(None)
+                self.logger.debug(
+                    "None found as a key value for store {} with key {}".format(
+                        store.name, store.key
+                    )
+                )
+        return unique_keys
+
     def get_items(self) -> Iterable:
         """
         Gets items from source_stores for processing.
@@ -128,19 +239,8 @@ class Projection_Builder(Builder):
         if len(self.query_by_key) > 0:
             keys = self.query_by_key
         else:
-            unique_keys = set()  # type: Set
-            for store in self.sources:
-                store_keys = store.distinct(field=store.key)
-                unique_keys.update(store_keys)
-                if None in store_keys:
-                    self.logger.debug(
-                        "None found as a key value for store {} with key {}".format(
-                            store.collection_name, store.key
-                        )
-                    )
-            keys = list(unique_keys)
+            keys = list(self.get_distinct_keys())
             self.logger.info("{} distinct key values found".format(len(keys)))
-            self.logger.debug("None found in key values? {}".format(None in keys))
 
         # for every key (in chunks), query from each store and
         # project fields specified by projection_mapping
@@ -148,60 +248,87 @@ class Projection_Builder(Builder):
             chunked_keys = [k for k in chunked_keys if k is not None]
             self.logger.debug("Querying by chunked_keys: {}".format(chunked_keys))
 
-            unsorted_items_to_process = []
-            for store, projection in zip(self.sources, self.projection_mapping):
+            unsorted_items_to_process = []  # type: List[Dict]
+            for i, (store, projection) in enumerate(
+                zip(self.sources, self.projection_mapping)
+            ):
 
-                # project all fields from store if corresponding element
-                # in projection_mapping is an empty dict,
-                # else only project the specified fields
-                properties: Union[List, None]
+                # get docs from store for given chunk of key values,
+                # rename fields if specified by projection mapping,
+                # and put in list of unsorted items to be processed
                 if projection == {}:  # all fields are projected
-                    properties = None
                     self.logger.debug(
-                        "For store {} getting all properties".format(
-                            store.collection_name
-                        )
+                        "For store {} getting all properties".format(store.name)
                     )
                 else:  # only specified fields are projected
-                    properties = [v for v in projection.values()]
                     self.logger.debug(
                         "For {} store getting properties: {}".format(
-                            store.collection_name, properties
+                            store.name, list(projection.values())
                         )
                     )
 
-                # get docs from store for given chunk of key values,
-                # rename fields if specified by projection mapping,
-                # and put in list of unsorted items to be processed
-                docs = store.query(
-                    criteria={store.key: {"$in": chunked_keys}}, properties=properties
+                num_items = len(unsorted_items_to_process)
+                unsorted_items_to_process.extend(
+                    self._query_source(i, criteria={store.key: {"$in": chunked_keys}})
                 )
-                for d in docs:
-                    if properties is None:  # all fields are projected as is
-                        item = deepcopy(d)
-                    else:  # specified fields are renamed
-                        item = dict()
-                        for k, v in projection.items():
-                            item[k] = get(d, v)
-
-                    # remove unneeded fields and add key value to each item
-                    # key value stored under target_key is used for sorting
-                    # items during the process_items step
-                    for k in ["_id", store.last_updated_field]:
-                        if k in item.keys():
-                            del item[k]
-                    item[self.target.key] = d[store.key]
-
-                    unsorted_items_to_process.append(item)
 
-                self.logger.debug(
-                    "Example fields of one output item from {} store sent to process_items: {}".format(
-                        store.collection_name, item.keys()
+                if len(unsorted_items_to_process) > num_items:
+                    self.logger.debug(
+                        "Example fields of one output item from {} store sent to process_items: {}".format(
+                            store.name, unsorted_items_to_process[-1].keys()
+                        )
                     )
-                )
 
             yield unsorted_items_to_process
 
+    def _query_source(self, index: int, criteria: Dict) -> Iterator[Dict]:
+        """
+        Gets the docs matching criteria from the source store at index with
+        their fields projected and renamed as specified by its projection
+        mapping. Mongo-backed stores leave out unneeded fields and rename in
+        the database, fetching docs in batches of chunk_size. Any other store,
+        or a mapping with nested paths, is queried through Store.query and
+        the projection is done here.
+
+        Returns:
+            generator of items keyed by the target key
+        """
+        store = self.sources[index]
+        source_projection = self._source_projections[index]
+        all_fields = self.projection_mapping[index] == {}
+
+        if not isinstance(store, MongoStore) or source_projection is None:
+            strip_keys = self._source_strip_keys[index]
+            paths = self._source_paths[index]
+            for d in store.query(
+                criteria=criteria, properties=self._source_properties[index]
+            ):
+                if all_fields:  # all fields are projected as is
+                    item = {k: v for k, v in d.items() if k not in strip_keys}
+                else:  # specified fields are renamed
+                    item = {k: get(d, path) for k, path in paths}
+                item[self.target.key] = d[store.key]
+                yield item
+
+        elif all_fields:
+            for item in store._collection.find(
+                filter=criteria, projection=source_projection, batch_size=self.chunk_size
+            ):
+                # add key value to each item
+                # key value stored under target_key is used for sorting
+                # items during the process_items step
+                item[self.target.key] = item[store.key]
+                yield item
+
+        else:
+            # renaming is done server-side with an aggregation so only
+            # the projected fields are sent over the wire. The key is
+            # always in the projection under the target key name
+            yield from store._collection.aggregate(
+                [{"$match": criteria}, {"$project": source_projection}],
+                batchSize=self.chunk_size,
+            )
+
     def process_item(self, items: Union[List, Iterable]) -> List[Dict]:
         """
         Takes a chunk of items belonging to a subset of key values
@@ -217,12 +344,9 @@ class Projection_Builder(Builder):
         """
         self.logger.info("Processing items: sorting by key values...")
         key = self.target.key
-        items_sorted_by_key = {}  # type: Dict
+        items_sorted_by_key = defaultdict(list)  # type: Dict
         for i in items:
-            key_value = i[key]
-            if key_value not in items_sorted_by_key.keys():
-                items_sorted_by_key[key_value] = []
-            items_sorted_by_key[key_value].append(i)
+            items_sorted_by_key[i[key]].append(i)
 
         items_for_target = []
         for k, i_sorted in items_sorted_by_key.items():
@@ -247,14 +371,15 @@ class Projection_Builder(Builder):
                 all the information from the source_stores
                 corresponding to a single key value
         """
-        items = list(filter(None, chain.from_iterable(items)))
-        num_items = len(items)
-        self.logger.info("Updating target with {} items...".format(num_items))
         target = self.target
-
         target_insertion_time = datetime.utcnow()
-        for item in items:
-            item[target.last_updated_field] = target_insertion_time
+        items = [
+            {**item, target.last_updated_field: target_insertion_time}
+            for item in chain.from_iterable(items)
+            if item
+        ]
+        num_items = len(items)
+        self.logger.info("Updating target with {} items...".format(num_items))
 
         if num_items > 0:
             target.update(items)
@@ -16,6 +16,11 @@ from maggma.cli.serial import serial
 from maggma.cli.source_loader import ScriptFinder, load_builder_from_source
 from maggma.utils import ReportingHandler, TqdmLoggingHandler
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 sys.meta_path.append(ScriptFinder())
 
 
@@ -111,6 +116,10 @@ def run(
             for builder in builder_objects:
                 serial(builder, no_bars)
         else:
+            # uvloop has cheaper task scheduling and executor hand-off
+            # for the per item futures in multi if it is available
+            if uvloop is not None:
+                uvloop.install()
             loop = asyncio.get_event_loop()
             for builder in builder_objects:
                 loop.run_until_complete(
@@ -2,7 +2,8 @@
 # coding utf-8
 
 from asyncio import BoundedSemaphore, Queue, gather, get_event_loop, wait
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from logging import getLogger
 from types import GeneratorType
 
@@ -68,15 +69,17 @@ class AsyncUnorderedMap:
         self.results = Queue()
         self.tasks = {}
 
-    async def process_and_release(self, idx):
-        future = self.tasks[idx]
+    def process_and_release(self, idx, future):
+        """
+        Done callback that moves a finished result into the results queue
+        Failed items are passed on as None so the backpressure is still released
+        """
+        self.tasks.pop(idx, None)
         try:
-            item = await future
-            self.results.put_nowait(item)
+            item = future.result()
         except Exception:
-            pass
-        finally:
-            self.tasks.pop(idx)
+            item = None
+        self.results.put_nowait(item)
 
     async def get_from_iterator(self):
         loop = get_event_loop()
@@ -87,9 +90,10 @@ class AsyncUnorderedMap:
 
             self.tasks[idx] = future
 
-            loop.create_task(self.process_and_release(idx))
+            future.add_done_callback(partial(self.process_and_release, idx))
 
-        await gather(*self.tasks.values())
+        # a failed item must not stop the sentinel from being queued
+        await gather(*self.tasks.values(), return_exceptions=True)
         self.results.put_nowait(self.done_sentinel)
 
     def __aiter__(self):
@@ -130,10 +134,10 @@ async def grouper(async_iterator, n: int):
     chunk = []
     async for item in async_iterator:
         chunk.append(item)
-        if len(chunk) >= n:
+        if len(chunk) == n:
             yield chunk
-            chunk.clear()
-    if chunk != []:
+            chunk = []
+    if chunk:
         yield chunk
 
 
@@ -150,7 +154,14 @@ async def multi(builder, num_workers, no_bars=False):
 
     builder.connect()
     cursor = builder.get_items()
-    executor = ProcessPoolExecutor(num_workers)
+
+    # I/O bound builders (e.g. ones that query a database in process_item)
+    # don't benefit from separate processes since the GIL is released during
+    # socket I/O, so use threads to avoid the memory and pickling overhead
+    if getattr(builder, "cpu_bound", True):
+        executor = ProcessPoolExecutor(num_workers)
+    else:
+        executor = ThreadPoolExecutor(num_workers)
 
     # Gets the total number of items to process by priming
     # the cursor
@@ -182,43 +193,45 @@ async def multi(builder, num_workers, no_bars=False):
         },
     )
 
-    back_pressured_get = BackPressure(
-        iterator=tqdm(cursor, desc="Get", total=total, disable=no_bars),
-        n=builder.chunk_size,
-    )
+    with executor:
+        back_pressured_get = BackPressure(
+            iterator=tqdm(cursor, desc="Get", total=total, disable=no_bars),
+            n=builder.chunk_size,
+        )
 
-    processed_items = atqdm(
-        async_iterator=AsyncUnorderedMap(
-            func=builder.process_item,
-            async_iterator=back_pressured_get,
-            executor=executor,
-        ),
-        total=total,
-        desc="Process Items",
-        disable=no_bars,
-    )
+        processed_results = atqdm(
+            async_iterator=AsyncUnorderedMap(
+                func=builder.process_item,
+                async_iterator=back_pressured_get,
+                executor=executor,
+            ),
+            total=total,
+            desc="Process Items",
+            disable=no_bars,
+        )
 
-    back_pressure_relief = back_pressured_get.release(processed_items)
+        back_pressure_relief = back_pressured_get.release(processed_results)
 
-    update_items = tqdm(total=total, desc="Update Targets", disable=no_bars)
+        update_items = tqdm(total=total, desc="Update Targets", disable=no_bars)
 
-    async for chunk in grouper(back_pressure_relief, n=builder.chunk_size):
+        async for chunk in grouper(back_pressure_relief, n=builder.chunk_size):
 
-        logger.info(
-            "Processed batch of {} items".format(builder.chunk_size),
-            extra={
-                "maggma": {
-                    "event": "UPDATE",
-                    "items": len(chunk),
-                    "builder": builder.__class__.__name__,
-                    "sources": [source.name for source in builder.sources],
-                    "targets": [target.name for target in builder.targets],
-                }
-            },
-        )
-        processed_items = [item for item in chunk if item is not None]
-        builder.update_targets(processed_items)
-        update_items.update(len(processed_items))
+            logger.info(
+                "Processed batch of {} items".format(len(chunk)),
+                extra={
+                    "maggma": {
+                        "event": "UPDATE",
+                        "items": len(chunk),
+                        "builder": builder.__class__.__name__,
+                        "sources": [source.name for source in builder.sources],
+                        "targets": [target.name for target in builder.targets],
+                    }
+                },
+            )
+            # items that failed in process_item come back as None
+            processed_items = [item for item in chunk if item is not None]
+            builder.update_targets(processed_items)
+            update_items.update(len(processed_items))
 
     logger.info(
         f"Ended multiprocessing: {builder.__class__.__name__}",
@@ -22,8 +22,14 @@ class Builder(MSONable, metaclass=ABCMeta):
 
     Multiprocessing and MPI processing can be used if all
     the data processing is  limited to process_items
+
+    Builders whose process_item is dominated by I/O rather than
+    computation can set cpu_bound to False so that multiprocessing
+    runs process_item in threads instead of separate processes
     """
 
+    cpu_bound = True
+
     def __init__(
         self,
         sources: Union[List[Store], Store],
@@ -1,3 +1,4 @@
+from inspect import signature
 import pytest
 from enum import Enum
 from maggma.api.query_operator import (
@@ -15,7 +16,9 @@ from datetime import datetime
 from monty.serialization import loadfn, dumpfn
 from monty.tempfile import ScratchDir
 
+from maggma.api.query_operator.pagination import decode_cursor, encode_cursor
 from maggma.api.query_operator.submission import SubmissionQuery
+from bson import ObjectId
 
 
 class Owner(BaseModel):
@@ -31,10 +34,35 @@ def test_pagination_functionality():
 
     assert op.query(skip=10, limit=20) == {"limit": 20, "skip": 10}
 
+    assert "cursor" not in signature(op.query).parameters
+
+    op = PaginationQuery(enable_cursor=True)
+
+    assert op.query(skip=10, limit=20) == {"limit": 20, "skip": 10}
+    assert op.query(skip=0, limit=20, cursor="") == {
+        "limit": 20,
+        "skip": 0,
+        "cursor": "",
+    }
+
     with pytest.raises(HTTPException):
         op.query(limit=10000)
 
 
+@pytest.mark.parametrize(
+    "key_value", ["mp-1", 12, 1.5, datetime(2020, 1, 2, 3, 4, 5), ObjectId()]
+)
+def test_cursor_round_trip(key_value):
+    decoded = decode_cursor(encode_cursor(key_value))
+    assert decoded == key_value
+    assert type(decoded) is type(key_value)
+
+
+def test_invalid_cursor():
+    with pytest.raises(HTTPException):
+        decode_cursor("notacursor")
+
+
 def test_pagination_serialization():
 
     op = PaginationQuery()
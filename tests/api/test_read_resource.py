@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from random import randint
 from urllib.parse import urlencode
 
@@ -10,6 +10,8 @@ from starlette.testclient import TestClient
 
 from maggma.api.query_operator import (
     NumericQuery,
+    PaginationQuery,
+    SortQuery,
     SparseFieldsQuery,
     StringQueryOperator,
 )
@@ -79,6 +81,18 @@ def test_get_by_key(owner_store):
 
     assert client.get("/Person1/").status_code == 200
     assert client.get("/Person1/").json()["data"][0]["name"] == "Person1"
+    assert client.get("/Person1/").headers["content-type"] == "application/json"
+
+
+def test_unconnected_store():
+    store = MemoryStore("owners", key="name")
+    endpoint = ReadOnlyResource(store, Owner)
+    app = FastAPI()
+    app.include_router(endpoint.router)
+
+    with TestClient(app) as client:
+        assert client.get("/").status_code == 200
+        assert client.get("/Person1/").status_code == 404
 
 
 def test_key_fields(owner_store):
@@ -210,3 +224,86 @@ def test_resource_compound():
     assert len(data) == 1
     assert data[0]["name"] == "PersonAge20Weight200"
     assert "weight" not in data[0]
+
+
+def cursor_pages(client, params):
+    """
+    Follows next_cursor from an empty cursor and returns the names of all
+    documents along with the meta of each page
+    """
+    names, metas = [], []
+    cursor = ""
+    while cursor is not None:
+        res = client.get("/?" + urlencode({**params, "cursor": cursor}))
+        assert res.status_code == 200
+        names.extend(d["name"] for d in res.json()["data"])
+        metas.append(res.json()["meta"])
+        cursor = res.json()["meta"]["next_cursor"]
+    return names, metas
+
+
+@pytest.mark.parametrize("disable_validation", [True, False])
+def test_cursor_pagination(owner_store, disable_validation):
+    endpoint = ReadOnlyResource(
+        owner_store, Owner, disable_validation=disable_validation
+    )
+    app = FastAPI()
+    app.include_router(endpoint.router)
+
+    client = TestClient(app)
+
+    names, metas = cursor_pages(client, {"limit": 5})
+    assert names == sorted(o.name for o in owners)
+    assert len(metas) == 3
+    assert all(meta["total_doc"] is None for meta in metas)
+
+    assert client.get("/?cursor=notacursor").status_code == 400
+
+
+def test_cursor_pagination_criteria(owner_store):
+    endpoint = ReadOnlyResource(
+        owner_store,
+        Owner,
+        query_operators=[
+            PaginationQuery(enable_cursor=True),
+            NumericQuery(model=Owner),
+            SortQuery(),
+            SparseFieldsQuery(model=Owner, default_fields=["name", "age"]),
+        ],
+    )
+    app = FastAPI()
+    app.include_router(endpoint.router)
+
+    client = TestClient(app)
+
+    names, _ = cursor_pages(client, {"limit": 3, "age_max": 9})
+    assert names == sorted(o.name for o in owners if o.age <= 9)
+
+    res = client.get("/?cursor=&sort_field=age&ascending=true")
+    assert res.status_code == 400
+
+    res = client.get("/?cursor=&skip=5")
+    assert res.status_code == 400
+
+
+def test_cursor_pagination_datetime_key():
+    store = MemoryStore("owners", key="last_updated")
+    store.connect()
+    store.update(
+        [
+            Owner(
+                name=f"Person{i}", age=i, last_updated=datetime(2020, 1, 1) + timedelta(i)
+            ).dict()
+            for i in range(7)
+        ]
+    )
+
+    endpoint = ReadOnlyResource(store, Owner)
+    app = FastAPI()
+    app.include_router(endpoint.router)
+
+    client = TestClient(app)
+
+    names, metas = cursor_pages(client, {"limit": 3, "all_fields": True})
+    assert names == [f"Person{i}" for i in range(7)]
+    assert len(metas) == 3
@@ -5,7 +5,8 @@ Tests for Projection_Builder
 import pytest
 
 from maggma.builders.projection_builder import Projection_Builder
-from maggma.stores import MemoryStore
+from maggma.stores import MemoryStore, MongoStore
+from maggma.stores.advanced_stores import SandboxStore
 
 
 @pytest.fixture
@@ -43,6 +44,41 @@ def test_get_items(source1, source2, target):
     assert len(items) == 25
 
 
+def test_get_distinct_keys(source1, source2, target):
+    builder = Projection_Builder(source_stores=[source1, source2], target_store=target)
+    assert builder.get_distinct_keys() == set(range(15))
+
+    source1.update([{"k": None, "z": "z"}], key="z")
+    assert builder.get_distinct_keys() == set(range(15))
+
+
+def test_get_distinct_keys_same_database(target, mocker):
+    database = mocker.MagicMock()
+    sources = []
+    for name in ["source1", "source2", "source3"]:
+        store = MongoStore("maggma_test", name, key="k", last_updated_field="lu")
+        store._collection = mocker.MagicMock(database=database)
+        store._collection.name = name
+        sources.append(store)
+    sources[0]._collection.aggregate.return_value = [{"_id": k} for k in range(3)]
+
+    builder = Projection_Builder(source_stores=sources, target_store=target)
+    assert builder.get_distinct_keys() == {0, 1, 2}
+
+    pipeline = sources[0]._collection.aggregate.call_args[0][0]
+    assert pipeline == [
+        {"$group": {"_id": "$k"}},
+        {"$unionWith": {"coll": "source2", "pipeline": [{"$group": {"_id": "$k"}}]}},
+        {"$unionWith": {"coll": "source3", "pipeline": [{"$group": {"_id": "$k"}}]}},
+        {"$match": {"_id": {"$ne": None}}},
+        {"$group": {"_id": "$_id"}},
+    ]
+    for store in sources:
+        store._collection.distinct.assert_not_called()
+    for store in sources[1:]:
+        store._collection.aggregate.assert_not_called()
+
+
 def test_process_item(source1, source2, target):
     # test fields_to_project = empty dict and list
     builder = Projection_Builder(
@@ -84,6 +120,33 @@ def test_process_item(source1, source2, target):
     assert all([k not in ["a", "c"] for k in output.keys()])
 
 
+def test_missing_projected_fields(source1, source2, target):
+    source1.update([{"k": 20, "b": "b"}])
+    builder = Projection_Builder(
+        source_stores=[source1, source2],
+        target_store=target,
+        fields_to_project=[{"newa": "a", "b": "b"}, ["d"]],
+        query_by_key=[20],
+    )
+    items = [i for i in builder.get_items()][0]
+    assert builder.process_item(items) == [{"k": 20, "newa": None, "b": "b"}]
+
+
+def test_nested_projected_fields(source1, source2, target):
+    source1.update([{"k": 20, "sub": [{"c": 1}, {"c": 2}], "x": "x"}])
+    builder = Projection_Builder(
+        source_stores=[source1, source2],
+        target_store=target,
+        fields_to_project=[{"all_c": "sub.c", "first_c": "sub.0.c", "x.y": "x"}, []],
+        query_by_key=[20],
+    )
+    assert builder._source_projections[0] is None
+    items = [i for i in builder.get_items()][0]
+    assert builder.process_item(items) == [
+        {"k": 20, "all_c": None, "first_c": 1, "x.y": "x"}
+    ]
+
+
 def test_update_targets(source1, source2, target):
     builder = Projection_Builder(
         source_stores=[source1, source2],
@@ -120,3 +183,30 @@ def test_query(source1, source2, target):
     )
     builder.run()
     assert len(list(target.query())) == 5
+
+
+def test_wrapped_source_store(source2, target):
+    memstore = MemoryStore("sandboxed", key="k", last_updated_field="lu")
+    sandbox = SandboxStore(memstore, sandbox="test", exclusive=True)
+    sandbox.connect()
+    sandbox.update([{"k": k, "a": "a"} for k in range(5)])
+    memstore.update([{"k": k, "a": "hidden", "sbxn": ["other"]} for k in range(5, 10)])
+
+    builder = Projection_Builder(
+        source_stores=[sandbox, source2],
+        target_store=target,
+        fields_to_project=[{"newa": "a"}, []],
+    )
+    builder.run()
+    assert len(list(target.query())) == 15
+    assert target.query_one(criteria={"k": 0})["newa"] == "a"
+    assert target.query_one(criteria={"k": 0})["c"] == "c"
+    assert target.query_one(criteria={"k": 7})["c"] == "c"
+    assert "newa" not in target.query_one(criteria={"k": 7}).keys()
+
+    # all fields projected from the wrapper store
+    target.remove_docs({})
+    builder = Projection_Builder(source_stores=[sandbox], target_store=target)
+    builder.run()
+    assert sorted(d["k"] for d in target.query()) == list(range(5))
+    assert target.query_one(criteria={"k": 0})["a"] == "a"
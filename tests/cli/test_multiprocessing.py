@@ -4,12 +4,16 @@ from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+import maggma.cli.multiprocessing as multiprocessing
 from maggma.cli.multiprocessing import (
     AsyncUnorderedMap,
     BackPressure,
     grouper,
+    multi,
     safe_dispatch,
 )
+from maggma.core import Builder
+from maggma.stores import MemoryStore
 
 
 @pytest.mark.asyncio
@@ -24,6 +28,9 @@ async def test_grouper():
     async for group in grouper(arange(9), n=10):
         assert len(group) == 9
 
+    groups = [group async for group in grouper(arange(25), n=10)]
+    assert groups == [list(range(10)), list(range(10, 20)), list(range(20, 25))]
+
 
 def wait_and_return(x):
     time.sleep(1)
@@ -84,3 +91,52 @@ def test_safe_dispatch():
         raise ValueError("AAAH")
 
     safe_dispatch((bad_func, ""))
+
+
+class SquareBuilder(Builder):
+    cpu_bound = False
+
+    def get_items(self):
+        return list(self.sources[0].query())
+
+    def process_item(self, item):
+        return {"k": item["k"], "v": item["v"] ** 2}
+
+    def update_targets(self, items):
+        self.targets[0].update(items)
+
+
+@pytest.mark.asyncio
+async def test_multi_threads(monkeypatch):
+    source = MemoryStore("source", key="k")
+    target = MemoryStore("target", key="k")
+    source.connect()
+    target.connect()
+    source.update([{"k": k, "v": k} for k in range(10)])
+
+    executors = []
+
+    class RecordingThreadPoolExecutor(ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.was_shutdown = False
+            executors.append(self)
+
+        def shutdown(self, *args, **kwargs):
+            self.was_shutdown = True
+            super().shutdown(*args, **kwargs)
+
+    def no_processes(*args, **kwargs):
+        raise AssertionError("cpu_bound = False should not start processes")
+
+    monkeypatch.setattr(
+        multiprocessing, "ThreadPoolExecutor", RecordingThreadPoolExecutor
+    )
+    monkeypatch.setattr(multiprocessing, "ProcessPoolExecutor", no_processes)
+
+    builder = SquareBuilder(sources=source, targets=target, chunk_size=3)
+    await multi(builder, num_workers=2, no_bars=True)
+
+    assert len(executors) == 1
+    assert executors[0].was_shutdown
+    assert {d["k"]: d["v"] for d in target.query()} == {k: k * k for k in range(10)}